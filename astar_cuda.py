@@ -0,0 +1,196 @@
+
+"""
+Batched CUDA A* for many (start, goal) queries on one static grid
+"""
+from typing import List, Sequence, Tuple
+import time
+
+import numpy as np
+
+from astar_sample import AStarSearch, SearchResult
+
+try:
+    from numba import cuda
+    CUDA_AVAILABLE = cuda.is_available()
+except ImportError:
+    cuda = None
+    CUDA_AVAILABLE = False
+
+THREADS_PER_BLOCK = 128
+_IDX_MASK = 0xFFFFFFFF
+
+if CUDA_AVAILABLE:
+
+    @cuda.jit(device=True)
+    def _heap_push(heap, size, key):
+        """Push key onto the binary min-heap heap[:size]"""
+        i = size
+        heap[i] = key
+        while i > 0:
+            p = (i - 1) >> 1
+            if heap[p] <= heap[i]:
+                break
+            tmp = heap[p]
+            heap[p] = heap[i]
+            heap[i] = tmp
+            i = p
+        return size + 1
+
+    @cuda.jit(device=True)
+    def _heap_pop(heap, size):
+        """Remove the smallest key from heap[:size]; returns the new size"""
+        size -= 1
+        if size > 0:
+            heap[0] = heap[size]
+            i = 0
+            while True:
+                left = 2 * i + 1
+                if left >= size:
+                    break
+                child = left
+                if left + 1 < size and heap[left + 1] < heap[left]:
+                    child = left + 1
+                if heap[i] <= heap[child]:
+                    break
+                tmp = heap[i]
+                heap[i] = heap[child]
+                heap[child] = tmp
+                i = child
+        return size
+
+    @cuda.jit
+    def _astar_batch_kernel(blocked, starts, goals, g_score, parent, closed, heap,
+                            costs, expanded):
+        """One thread solves one query using its own rows of the scratch arrays"""
+        q = cuda.grid(1)
+        if q >= starts.shape[0]:
+            return
+
+        height, width = blocked.shape
+        g = g_score[q]
+        par = parent[q]
+        done = closed[q]
+        open_set = heap[q]
+
+        sx, sy = starts[q, 0], starts[q, 1]
+        gx, gy = goals[q, 0], goals[q, 1]
+        start_idx = sy * width + sx
+        g[start_idx] = 0
+        size = _heap_push(open_set, 0, (np.int64(abs(sx - gx) + abs(sy - gy)) << 32) | start_idx)
+        costs[q] = -1
+        n_expanded = 0
+
+        while size > 0:
+            key = open_set[0]
+            size = _heap_pop(open_set, size)
+            idx = key & _IDX_MASK
+            y = idx // width
+            x = idx - y * width
+
+            if done[idx]:
+                continue
+            if x == gx and y == gy:
+                costs[q] = g[idx]
+                break
+
+            done[idx] = 1
+            n_expanded += 1
+            tentative = g[idx] + 1
+
+            for d in range(4):
+                nx, ny = x, y
+                if d == 0:
+                    nx = x + 1
+                elif d == 1:
+                    nx = x - 1
+                elif d == 2:
+                    ny = y + 1
+                else:
+                    ny = y - 1
+
+                if nx < 0 or nx >= width or ny < 0 or ny >= height:
+                    continue
+                n_idx = ny * width + nx
+                if blocked[ny, nx] or done[n_idx]:
+                    continue
+                if tentative < g[n_idx]:
+                    g[n_idx] = tentative
+                    par[n_idx] = idx
+                    f = np.int64(tentative + abs(nx - gx) + abs(ny - gy))
+                    size = _heap_push(open_set, size, (f << 32) | n_idx)
+
+        expanded[q] = n_expanded
+
+
+def batch_search(grid_world, queries: Sequence[Tuple[Tuple[int, int], Tuple[int, int]]],
+                 batch_size: int = 256) -> List[SearchResult]:
+    """
+    Solve many (start, goal) queries on the same static grid
+
+    The obstacle bitmap is copied to the device once; each batch of queries
+    gets per-query g/parent/closed/heap rows in device memory (about
+    50 bytes per cell per query, so size batch_size to fit). Without CUDA
+    the queries run one by one through AStarSearch.
+
+    Args:
+        grid_world: GridWorld to search; dynamic obstacles are ignored
+        queries: Sequence of (start, goal) positions
+        batch_size: Queries launched per kernel
+
+    Returns:
+        One SearchResult per query, in order
+    """
+    if not CUDA_AVAILABLE:
+        search = AStarSearch(grid_world)
+        return [search.search(start, goal) for start, goal in queries]
+
+    height, width = grid_world._blocked.shape
+    n_cells = height * width
+    d_blocked = cuda.to_device(grid_world._blocked.view(np.int8))
+    results = []
+
+    for offset in range(0, len(queries), batch_size):
+        batch = queries[offset:offset + batch_size]
+        n = len(batch)
+        start_time = time.time()
+
+        starts = np.array([start for start, _ in batch], dtype=np.int32)
+        goals = np.array([goal for _, goal in batch], dtype=np.int32)
+        d_g = cuda.to_device(np.full((n, n_cells), np.iinfo(np.int32).max, dtype=np.int32))
+        d_parent = cuda.to_device(np.full((n, n_cells), -1, dtype=np.int32))
+        d_closed = cuda.to_device(np.zeros((n, n_cells), dtype=np.int8))
+        d_heap = cuda.device_array((n, 4 * n_cells + 1), dtype=np.int64)
+        d_costs = cuda.device_array(n, dtype=np.int32)
+        d_expanded = cuda.device_array(n, dtype=np.int32)
+
+        blocks = (n + THREADS_PER_BLOCK - 1) // THREADS_PER_BLOCK
+        _astar_batch_kernel[blocks, THREADS_PER_BLOCK](
+            d_blocked, cuda.to_device(starts), cuda.to_device(goals),
+            d_g, d_parent, d_closed, d_heap, d_costs, d_expanded)
+
+        costs = d_costs.copy_to_host()
+        expanded = d_expanded.copy_to_host()
+        parents = d_parent.copy_to_host()
+        per_query_time = (time.time() - start_time) / n
+
+        for i, (_, goal) in enumerate(batch):
+            if costs[i] < 0:
+                results.append(SearchResult(path=[], cost=float('inf'),
+                                            nodes_expanded=int(expanded[i]),
+                                            computation_time=per_query_time, success=False))
+                continue
+
+            keys = []
+            current = goal[1] * width + goal[0]
+            while current != -1:
+                keys.append(current)
+                current = parents[i, current]
+            results.append(SearchResult(
+                path=[(int(k % width), int(k // width)) for k in reversed(keys)],
+                cost=int(costs[i]),
+                nodes_expanded=int(expanded[i]),
+                computation_time=per_query_time,
+                success=True
+            ))
+
+    return results
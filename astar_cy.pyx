@@ -0,0 +1,127 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Cython A* core for Autonomous Delivery Agent grids
+
+Ahead-of-time alternative to astar_numba for environments without numba.
+Build in place with:
+
+    cythonize -i astar_cy.pyx
+"""
+from libc.stdint cimport int8_t, uint8_t, int32_t, int64_t
+
+cdef int64_t _IDX_MASK = 0xFFFFFFFF
+
+cdef inline void _heap_push(int64_t* heap, Py_ssize_t* size, int64_t key) noexcept nogil:
+    """Push key onto the binary min-heap heap[:size]"""
+    cdef Py_ssize_t i = size[0]
+    cdef Py_ssize_t p
+    heap[i] = key
+    while i > 0:
+        p = (i - 1) >> 1
+        if heap[p] <= heap[i]:
+            break
+        heap[p], heap[i] = heap[i], heap[p]
+        i = p
+    size[0] += 1
+
+cdef inline int64_t _heap_pop(int64_t* heap, Py_ssize_t* size) noexcept nogil:
+    """Pop the smallest key from heap[:size]"""
+    cdef int64_t top = heap[0]
+    cdef Py_ssize_t n, i, left, child
+    size[0] -= 1
+    n = size[0]
+    if n > 0:
+        heap[0] = heap[n]
+        i = 0
+        while True:
+            left = 2 * i + 1
+            if left >= n:
+                break
+            child = left
+            if left + 1 < n and heap[left + 1] < heap[left]:
+                child = left + 1
+            if heap[i] <= heap[child]:
+                break
+            heap[i], heap[child] = heap[child], heap[i]
+            i = child
+    return top
+
+def astar_core(int8_t[:, :] blocked, int sx, int sy, int gx, int gy,
+               int32_t[:, :] g_out, int32_t[:, :] parent,
+               int64_t[::1] heap_buf, uint8_t[::1] closed):
+    """
+    A* over a 4-connected unit-cost grid with an inlined Manhattan heuristic
+
+    blocked is the GridWorld static obstacle bitmap viewed as int8. g_out
+    must be filled with INT32_MAX, parent with -1 and closed (H * W
+    entries) with 0; heap_buf needs 4 * H * W + 1 entries. The caller owns
+    all four so they can be reused across queries. On return parent holds
+    the packed (y * W + x) predecessor of every reached cell.
+
+    Returns:
+        (cost, nodes_expanded); cost is -1 when the goal is unreachable
+    """
+    cdef int height = blocked.shape[0]
+    cdef int width = blocked.shape[1]
+    cdef Py_ssize_t n_cells = <Py_ssize_t>height * width
+    cdef int64_t* heap
+    cdef Py_ssize_t size = 0
+    cdef int64_t key, idx, f
+    cdef int x, y, nx, ny, d
+    cdef int32_t tentative
+    cdef int64_t cost = -1
+    cdef long nodes_expanded = 0
+
+    # The loop below runs without the GIL or bounds checks
+    if not (0 <= sx < width and 0 <= sy < height and 0 <= gx < width and 0 <= gy < height):
+        raise ValueError("start or goal lies outside the grid")
+    if (g_out.shape[0] != height or g_out.shape[1] != width
+            or parent.shape[0] != height or parent.shape[1] != width):
+        raise ValueError("g_out and parent must match the shape of blocked")
+    if heap_buf.shape[0] < 4 * n_cells + 1 or closed.shape[0] < n_cells:
+        raise ValueError("heap_buf or closed is too small for the grid")
+    heap = &heap_buf[0]
+
+    with nogil:
+        g_out[sy, sx] = 0
+        _heap_push(heap, &size, ((<int64_t>(abs(sx - gx) + abs(sy - gy))) << 32)
+                   | (<int64_t>sy * width + sx))
+
+        while size > 0:
+            key = _heap_pop(heap, &size)
+            idx = key & _IDX_MASK
+            y = <int>(idx // width)
+            x = <int>(idx - <int64_t>y * width)
+
+            if closed[idx]:
+                continue
+
+            if x == gx and y == gy:
+                cost = g_out[y, x]
+                break
+
+            closed[idx] = 1
+            nodes_expanded += 1
+            tentative = g_out[y, x] + 1
+
+            for d in range(4):
+                if d == 0:
+                    nx, ny = x + 1, y
+                elif d == 1:
+                    nx, ny = x - 1, y
+                elif d == 2:
+                    nx, ny = x, y + 1
+                else:
+                    nx, ny = x, y - 1
+
+                if nx < 0 or nx >= width or ny < 0 or ny >= height:
+                    continue
+                if blocked[ny, nx] or closed[<int64_t>ny * width + nx]:
+                    continue
+                if tentative < g_out[ny, nx]:
+                    g_out[ny, nx] = tentative
+                    parent[ny, nx] = <int32_t>idx
+                    f = <int64_t>tentative + abs(nx - gx) + abs(ny - gy)
+                    _heap_push(heap, &size, (f << 32) | (<int64_t>ny * width + nx))
+
+    return cost, nodes_expanded
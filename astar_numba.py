@@ -0,0 +1,133 @@
+
+"""
+Numba-compiled A* core for Autonomous Delivery Agent grids
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator used when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+_IDX_MASK = 0xFFFFFFFF
+G_UNSET = np.iinfo(np.int32).max  # g_score fill value for unreached cells
+
+def scratch_heap_size(height, width):
+    """Heap capacity for one query: one push per incoming edge plus the start"""
+    return 4 * height * width + 1
+
+@njit(cache=True)
+def _heap_push(heap, size, key):
+    """Push key onto the binary min-heap stored in heap[:size]"""
+    i = size
+    heap[i] = key
+    while i > 0:
+        p = (i - 1) >> 1
+        if heap[p] <= heap[i]:
+            break
+        heap[p], heap[i] = heap[i], heap[p]
+        i = p
+    return size + 1
+
+@njit(cache=True)
+def _heap_pop(heap, size):
+    """Pop the smallest key from heap[:size]; returns (key, new_size)"""
+    top = heap[0]
+    size -= 1
+    if size > 0:
+        heap[0] = heap[size]
+        i = 0
+        while True:
+            left = 2 * i + 1
+            if left >= size:
+                break
+            child = left
+            if left + 1 < size and heap[left + 1] < heap[left]:
+                child = left + 1
+            if heap[i] <= heap[child]:
+                break
+            heap[i], heap[child] = heap[child], heap[i]
+            i = child
+    return top, size
+
+@njit(cache=True)
+def _astar_core(blocked, sx, sy, gx, gy, g_score, parent, closed, heap):
+    """
+    A* over a 4-connected unit-cost grid with an inlined Manhattan heuristic
+
+    blocked is the GridWorld static obstacle bitmap (True = obstacle). The
+    caller owns the scratch arrays so they can be reused across queries:
+    g_score (H, W) int32 filled with G_UNSET, parent (H, W, 2) int32 filled
+    with -1, closed (H, W) bool filled with False and heap an int64 array of
+    at least scratch_heap_size(H, W) entries.
+
+    Heap entries are packed as (f << 32) | (y * W + x).
+
+    Returns:
+        (path, cost, nodes_expanded) where path is an (L, 2) int32 array of
+        (x, y) positions; path is empty and cost is -1 when the goal is
+        unreachable
+    """
+    height, width = blocked.shape
+
+    g_score[sy, sx] = 0
+    h = abs(sx - gx) + abs(sy - gy)
+    size = _heap_push(heap, 0, (np.int64(h) << 32) | (sy * width + sx))
+    nodes_expanded = 0
+
+    while size > 0:
+        key, size = _heap_pop(heap, size)
+        idx = key & _IDX_MASK
+        y = idx // width
+        x = idx - y * width
+
+        if closed[y, x]:
+            continue
+
+        if x == gx and y == gy:
+            length = 1
+            cx, cy = x, y
+            while parent[cy, cx, 0] != -1:
+                cx, cy = parent[cy, cx, 0], parent[cy, cx, 1]
+                length += 1
+            path = np.empty((length, 2), dtype=np.int32)
+            cx, cy = x, y
+            for i in range(length - 1, -1, -1):
+                path[i, 0] = cx
+                path[i, 1] = cy
+                cx, cy = parent[cy, cx, 0], parent[cy, cx, 1]
+            return path, np.int64(g_score[y, x]), nodes_expanded
+
+        closed[y, x] = True
+        nodes_expanded += 1
+        tentative = g_score[y, x] + 1
+
+        for d in range(4):
+            if d == 0:
+                nx, ny = x + 1, y
+            elif d == 1:
+                nx, ny = x - 1, y
+            elif d == 2:
+                nx, ny = x, y + 1
+            else:
+                nx, ny = x, y - 1
+
+            if nx < 0 or nx >= width or ny < 0 or ny >= height:
+                continue
+            if blocked[ny, nx] or closed[ny, nx]:
+                continue
+            if tentative < g_score[ny, nx]:
+                g_score[ny, nx] = tentative
+                parent[ny, nx, 0] = x
+                parent[ny, nx, 1] = y
+                f = np.int64(tentative + abs(nx - gx) + abs(ny - gy))
+                size = _heap_push(heap, size, (f << 32) | (ny * width + nx))
+
+    return np.empty((0, 2), dtype=np.int32), np.int64(-1), nodes_expanded
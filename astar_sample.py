@@ -3,26 +3,25 @@
 A* Search Algorithm Implementation for Autonomous Delivery Agent
 """
 import heapq
+import itertools
+import math
 from typing import List, Tuple, Dict, Optional, Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 import time
 
-@dataclass
-class Node:
-    """Node class for A* search"""
-    position: Tuple[int, int]
-    g_cost: float = 0  # Cost from start
-    h_cost: float = 0  # Heuristic cost to goal
-    parent: Optional['Node'] = None
+import numpy as np
 
-    @property
-    def f_cost(self) -> float:
-        """Total cost (g + h)"""
-        return self.g_cost + self.h_cost
+from astar_numba import G_UNSET, NUMBA_AVAILABLE, _astar_core, scratch_heap_size
 
-    def __lt__(self, other):
-        """For priority queue comparison"""
-        return self.f_cost < other.f_cost
+try:
+    from astar_cy import astar_core as _astar_core_cy  # built with: cythonize -i astar_cy.pyx
+    CYTHON_AVAILABLE = True
+except ImportError:
+    _astar_core_cy = None
+    CYTHON_AVAILABLE = False
+
+_SQRT2_MINUS_1 = math.sqrt(2) - 1
+INF = float('inf')
 
 class Heuristics:
     """Heuristic functions for A* search"""
@@ -42,9 +41,9 @@ class Heuristics:
         """Diagonal distance for 8-connected grids"""
         dx = abs(pos1[0] - pos2[0])
         dy = abs(pos1[1] - pos2[1])
-        return max(dx, dy) + (1.414 - 1) * min(dx, dy)
+        return max(dx, dy) + _SQRT2_MINUS_1 * min(dx, dy)
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Result of pathfinding search"""
     path: List[Tuple[int, int]]
@@ -54,11 +53,25 @@ class SearchResult:
     success: bool
 
 class AStarSearch:
-    """A* Search Algorithm Implementation"""
+    """
+    A* Search Algorithm Implementation
+
+    With weight > 1 the priority becomes g + weight * h (weighted A*),
+    trading optimality for fewer expansions; paths cost at most weight times
+    the optimum. max_expansions bounds the work per query for real-time
+    replanning: when it runs out, the path to the expanded cell closest to
+    the goal (by heuristic) is returned with success=False.
+    """
 
-    def __init__(self, grid_world, heuristic: Callable = Heuristics.manhattan_distance):
+    def __init__(self, grid_world, heuristic: Callable = Heuristics.manhattan_distance,
+                 weight: float = 1.0, max_expansions: Optional[int] = None):
         self.grid_world = grid_world
         self.heuristic = heuristic
+        self.weight = weight
+        self.max_expansions = max_expansions
+        self._scratch = None       # per-cell lists reused by the Python search
+        self._core_scratch = None  # NumPy arrays reused by the Numba core
+        self._cy_scratch = None    # NumPy arrays reused by the Cython core
 
     def search(self, start: Tuple[int, int], goal: Tuple[int, int], 
                current_time: int = 0) -> SearchResult:
@@ -73,69 +86,134 @@ class AStarSearch:
         Returns:
             SearchResult containing path and metrics
         """
+        # Off-grid endpoints would alias onto real cells once packed, and the
+        # compiled cores do not bounds-check them
+        invalid = self._invalid_endpoints(start, goal)
+        if invalid is not None:
+            return invalid
+
+        if self._can_use_core(current_time):
+            if NUMBA_AVAILABLE:
+                return self._search_numba(start, goal)
+            return self._search_cython(start, goal)
+
         start_time = time.time()
 
-        # Initialize open and closed sets
-        open_set = []
-        closed_set = set()
+        # Positions are packed as y * width + x; search state is kept as
+        # flat per-cell arrays indexed by that key and unpacked only for
+        # neighbor lookup and on output.
+        width = self.grid_world.width
+        n_cells = width * self.grid_world.height
+        start_key = start[1] * width + start[0]
+        goal_key = goal[1] * width + goal[0]
+
+        # h_cache holds the heuristic, computed once per position; touched
+        # records every cell written so the next search can reset just those
+        g_score, came_from, closed, h_cache, open_set, touched = self._get_scratch(n_cells)
 
-        # Create start node
-        start_node = Node(position=start, g_cost=0, 
-                         h_cost=self.heuristic(start, goal))
-        heapq.heappush(open_set, start_node)
+        # With integer costs each heap entry is the single int
+        # f_cost * n_cells + key (heuristics are floored, which keeps a
+        # consistent heuristic consistent); otherwise it is an (f_cost, key)
+        # tuple. Stale entries left behind by a cheaper relaxation are
+        # skipped lazily on pop.
+        integer_keys = self.grid_world.has_integer_costs()
+        heuristic = self.heuristic
+        manhattan = heuristic is Heuristics.manhattan_distance
+        gx, gy = goal
 
-        # Keep track of nodes for path reconstruction
-        all_nodes = {start: start_node}
+        # The weight is folded into the cached heuristic
+        weight = self.weight
+        weighted = weight != 1
+        max_expansions = self.max_expansions
+
+        # Bind everything the loop touches to locals
+        push = heapq.heappush
+        pop = heapq.heappop
+        get_neighbors = self.grid_world.get_neighbors
+        get_terrain_cost = self.grid_world.get_terrain_cost
+        mark_touched = touched.append
+
+        h_start = heuristic(start, goal) * weight if weighted else heuristic(start, goal)
+        g_score[start_key] = 0
+        h_cache[start_key] = int(h_start) if integer_keys else h_start
+        touched.append(start_key)
+        open_set.append(h_cache[start_key] * n_cells + start_key if integer_keys
+                        else (h_cache[start_key], start_key))
         nodes_expanded = 0
+        best_key, best_h = start_key, h_cache[start_key]
 
         while open_set:
-            # Get node with lowest f_cost
-            current_node = heapq.heappop(open_set)
-            current_pos = current_node.position
+            # Get position with lowest f_cost
+            entry = pop(open_set)
+            if integer_keys:
+                f_cost, current = divmod(entry, n_cells)
+            else:
+                f_cost, current = entry
+
+            # Skip entries superseded by a cheaper relaxation: their f is
+            # above the f of the best known g (recomputed exactly as pushed)
+            if closed[current] or f_cost > g_score[current] + h_cache[current]:
+                continue
 
             # Check if goal reached
-            if current_pos == goal:
-                path = self._reconstruct_path(current_node)
+            if current == goal_key:
+                path = self._reconstruct_path(came_from, goal_key, width)
                 computation_time = time.time() - start_time
                 return SearchResult(
                     path=path,
-                    cost=current_node.g_cost,
+                    cost=g_score[goal_key],
                     nodes_expanded=nodes_expanded,
                     computation_time=computation_time,
                     success=True
                 )
 
+            # Out of budget: return the best partial path found so far
+            if max_expansions is not None and nodes_expanded >= max_expansions:
+                return SearchResult(
+                    path=self._reconstruct_path(came_from, best_key, width),
+                    cost=g_score[best_key],
+                    nodes_expanded=nodes_expanded,
+                    computation_time=time.time() - start_time,
+                    success=False
+                )
+
             # Add to closed set
-            closed_set.add(current_pos)
+            closed[current] = 1
             nodes_expanded += 1
+            current_g = g_score[current]
+            if h_cache[current] < best_h:
+                best_key, best_h = current, h_cache[current]
+            y, x = divmod(current, width)
 
             # Explore neighbors
-            for neighbor_pos in self.grid_world.get_neighbors(*current_pos, current_time):
-                if neighbor_pos in closed_set:
+            for nx, ny in get_neighbors(x, y, current_time):
+                neighbor = ny * width + nx
+                if closed[neighbor]:
                     continue
 
                 # Calculate g_cost for neighbor
-                move_cost = self.grid_world.get_terrain_cost(*neighbor_pos)
-                tentative_g_cost = current_node.g_cost + move_cost
+                move_cost = get_terrain_cost(nx, ny)
+                tentative_g_cost = current_g + move_cost
 
                 # Check if this path to neighbor is better
-                if neighbor_pos in all_nodes:
-                    neighbor_node = all_nodes[neighbor_pos]
-                    if tentative_g_cost < neighbor_node.g_cost:
-                        # Update existing node
-                        neighbor_node.g_cost = tentative_g_cost
-                        neighbor_node.parent = current_node
-                        heapq.heappush(open_set, neighbor_node)
-                else:
-                    # Create new node
-                    neighbor_node = Node(
-                        position=neighbor_pos,
-                        g_cost=tentative_g_cost,
-                        h_cost=self.heuristic(neighbor_pos, goal),
-                        parent=current_node
-                    )
-                    all_nodes[neighbor_pos] = neighbor_node
-                    heapq.heappush(open_set, neighbor_node)
+                if tentative_g_cost < g_score[neighbor]:
+                    g_score[neighbor] = tentative_g_cost
+                    came_from[neighbor] = current
+                    h_cost = h_cache[neighbor]
+                    if h_cost is None:
+                        mark_touched(neighbor)
+                        if manhattan:
+                            h_cost = abs(nx - gx) + abs(ny - gy)
+                        else:
+                            h_cost = heuristic((nx, ny), goal)
+                        if weighted:
+                            h_cost *= weight
+                        if integer_keys and (weighted or not manhattan):
+                            h_cost = int(h_cost)
+                        h_cache[neighbor] = h_cost
+                    f_cost = tentative_g_cost + h_cost
+                    push(open_set, f_cost * n_cells + neighbor if integer_keys
+                         else (f_cost, neighbor))
 
         # No path found
         computation_time = time.time() - start_time
@@ -147,16 +225,246 @@ class AStarSearch:
             success=False
         )
 
-    def _reconstruct_path(self, goal_node: Node) -> List[Tuple[int, int]]:
-        """Reconstruct path from goal to start"""
-        path = []
-        current = goal_node
+    def _get_scratch(self, n_cells: int):
+        """Return reset per-cell search arrays, reallocating if the grid size changed"""
+        scratch = self._scratch
+        if scratch is None or len(scratch[0]) != n_cells:
+            scratch = self._scratch = ([INF] * n_cells, [-1] * n_cells, bytearray(n_cells),
+                                       [None] * n_cells, [], [])
+            return scratch
+
+        g_score, came_from, closed, h_cache, open_set, touched = scratch
+        for key in touched:
+            g_score[key] = INF
+            came_from[key] = -1
+            closed[key] = 0
+            h_cache[key] = None
+        touched.clear()
+        open_set.clear()
+        return scratch
+
+    def _invalid_endpoints(self, start: Tuple[int, int],
+                           goal: Tuple[int, int]) -> Optional[SearchResult]:
+        """Failed result when start or goal lies outside the grid, else None"""
+        if self.grid_world.is_valid_position(*start) and self.grid_world.is_valid_position(*goal):
+            return None
+        return SearchResult(path=[], cost=INF, nodes_expanded=0,
+                            computation_time=0.0, success=False)
+
+    def _can_use_core(self, current_time: int) -> bool:
+        """Whether a compiled core applies (Manhattan, static obstacles only)"""
+        return ((NUMBA_AVAILABLE or CYTHON_AVAILABLE)
+                and self.heuristic is Heuristics.manhattan_distance
+                and self.weight == 1 and self.max_expansions is None
+                and getattr(self.grid_world, '_blocked', None) is not None
+                and not self.grid_world.dynamic_obstacles.get(current_time))
+
+    def _search_numba(self, start: Tuple[int, int], goal: Tuple[int, int]) -> SearchResult:
+        """Run the compiled core directly on the static obstacle bitmap"""
+        start_time = time.time()
+        blocked = self.grid_world._blocked
+        scratch = self._core_scratch
+        if scratch is None or scratch[0].shape != blocked.shape:
+            height, width = blocked.shape
+            scratch = self._core_scratch = (
+                np.empty((height, width), dtype=np.int32),
+                np.empty((height, width, 2), dtype=np.int32),
+                np.empty((height, width), dtype=bool),
+                np.empty(scratch_heap_size(height, width), dtype=np.int64),
+            )
+        g_score, parent, closed, heap = scratch
+        g_score.fill(G_UNSET)
+        parent.fill(-1)
+        closed.fill(False)
+
+        path, cost, nodes_expanded = _astar_core(blocked, start[0], start[1], goal[0], goal[1],
+                                                 g_score, parent, closed, heap)
+        return SearchResult(
+            path=[(int(x), int(y)) for x, y in path],
+            cost=int(cost) if cost >= 0 else INF,
+            nodes_expanded=nodes_expanded,
+            computation_time=time.time() - start_time,
+            success=len(path) > 0
+        )
+
+    def _search_cython(self, start: Tuple[int, int], goal: Tuple[int, int]) -> SearchResult:
+        """Run the Cython core on the static obstacle bitmap"""
+        start_time = time.time()
+        blocked = self.grid_world._blocked
+        scratch = self._cy_scratch
+        if scratch is None or scratch[0].shape != blocked.shape:
+            height, width = blocked.shape
+            scratch = self._cy_scratch = (
+                np.empty((height, width), dtype=np.int32),
+                np.empty((height, width), dtype=np.int32),
+                np.empty(scratch_heap_size(height, width), dtype=np.int64),
+                np.empty(height * width, dtype=np.uint8),
+            )
+        g_score, parent, heap, closed = scratch
+        g_score.fill(G_UNSET)
+        parent.fill(-1)
+        closed.fill(0)
+
+        cost, nodes_expanded = _astar_core_cy(blocked.view(np.int8), start[0], start[1],
+                                              goal[0], goal[1], g_score, parent, heap, closed)
+        success = cost >= 0
+        width = blocked.shape[1]
+        path = (self._reconstruct_path(parent.reshape(-1), goal[1] * width + goal[0], width)
+                if success else [])
+        return SearchResult(
+            path=path,
+            cost=cost if success else INF,
+            nodes_expanded=nodes_expanded,
+            computation_time=time.time() - start_time,
+            success=success
+        )
+
+    def _reconstruct_path(self, came_from, goal_key: int,
+                          width: int) -> List[Tuple[int, int]]:
+        """
+        Reconstruct path from goal to start, unpacking keys to (x, y)
+
+        came_from is a flat list or int array of packed parent keys; only
+        the cells on the path are read.
+        """
+        keys = []
+        current = goal_key
+
+        while current != -1:
+            keys.append(current)
+            current = int(came_from[current])
+
+        return [(key % width, key // width) for key in reversed(keys)]
+
+class BiAStarSearch(AStarSearch):
+    """
+    Bidirectional A* Search for point-to-point queries
+
+    Always optimal and unbounded: the weighted and expansion-bounded modes
+    of AStarSearch are not supported.
+    """
+
+    def __init__(self, grid_world, heuristic: Callable = Heuristics.manhattan_distance,
+                 weight: float = 1.0, max_expansions: Optional[int] = None):
+        if weight != 1 or max_expansions is not None:
+            raise ValueError("BiAStarSearch does not support weight or max_expansions")
+        super().__init__(grid_world, heuristic)
 
-        while current is not None:
-            path.append(current.position)
-            current = current.parent
+    def search(self, start: Tuple[int, int], goal: Tuple[int, int],
+               current_time: int = 0) -> SearchResult:
+        """
+        Perform A* from both ends and join the frontiers where they meet
+
+        Expansions alternate between the forward (start -> goal) and
+        backward (goal -> start) searches. The search stops once the
+        larger of the two open-set minima can no longer beat the best
+        meeting cost found so far.
+
+        Args:
+            start: Starting position (x, y)
+            goal: Goal position (x, y)
+            current_time: Current time step for dynamic obstacles
+
+        Returns:
+            SearchResult containing path and metrics
+        """
+        invalid = self._invalid_endpoints(start, goal)
+        if invalid is not None:
+            return invalid
+
+        start_time = time.time()
+
+        grid_world = self.grid_world
+        heuristic = self.heuristic
+        width = grid_world.width
+        start_key = start[1] * width + start[0]
+        goal_key = goal[1] * width + goal[0]
+
+        # Index 0 is the forward search, index 1 the backward search
+        n_cells = width * grid_world.height
+        counter = itertools.count()
+        targets = (goal, start)
+        g_scores = ([INF] * n_cells, [INF] * n_cells)
+        came_froms = ([-1] * n_cells, [-1] * n_cells)
+        closed_sets = (bytearray(n_cells), bytearray(n_cells))
+        g_scores[0][start_key] = 0
+        g_scores[1][goal_key] = 0
+        open_sets = ([(heuristic(start, goal), next(counter), start_key)],
+                     [(heuristic(goal, start), next(counter), goal_key)])
+        # get_terrain_cost does not check obstacles, so a blocked goal must
+        # not seed the backward search (forward A* can never enter it)
+        if start_key != goal_key and grid_world.is_obstacle(goal[0], goal[1], current_time):
+            open_sets[1].clear()
+
+        best_cost = 0 if start_key == goal_key else INF
+        meet = start_key if start_key == goal_key else None
+        nodes_expanded = 0
+        side = 0
 
-        return list(reversed(path))
+        while open_sets[0] and open_sets[1]:
+            if max(open_sets[0][0][0], open_sets[1][0][0]) >= best_cost:
+                break
+
+            open_set = open_sets[side]
+            closed_set = closed_sets[side]
+            g_score = g_scores[side]
+            came_from = came_froms[side]
+            other_g = g_scores[1 - side]
+            target = targets[side]
+
+            _, _, current = heapq.heappop(open_set)
+            if closed_set[current]:
+                side ^= 1
+                continue
+
+            closed_set[current] = 1
+            nodes_expanded += 1
+            current_g = g_score[current]
+            y, x = divmod(current, width)
+
+            # Backward edges cost what entering the current cell costs going forward
+            leave_cost = grid_world.get_terrain_cost(x, y) if side else None
+
+            for nx, ny in grid_world.get_neighbors(x, y, current_time):
+                neighbor = ny * width + nx
+                if closed_set[neighbor]:
+                    continue
+
+                move_cost = leave_cost if side else grid_world.get_terrain_cost(nx, ny)
+                tentative_g_cost = current_g + move_cost
+
+                if tentative_g_cost < g_score[neighbor]:
+                    g_score[neighbor] = tentative_g_cost
+                    came_from[neighbor] = current
+                    f_cost = tentative_g_cost + heuristic((nx, ny), target)
+                    heapq.heappush(open_set, (f_cost, next(counter), neighbor))
+
+                    # Frontiers touch: record the best joined path
+                    if tentative_g_cost + other_g[neighbor] < best_cost:
+                        best_cost = tentative_g_cost + other_g[neighbor]
+                        meet = neighbor
+
+            side ^= 1
+
+        computation_time = time.time() - start_time
+        if meet is None:
+            return SearchResult(
+                path=[],
+                cost=float('inf'),
+                nodes_expanded=nodes_expanded,
+                computation_time=computation_time,
+                success=False
+            )
+
+        forward = self._reconstruct_path(came_froms[0], meet, width)
+        backward = self._reconstruct_path(came_froms[1], meet, width)
+        return SearchResult(
+            path=forward + backward[-2::-1],
+            cost=best_cost,
+            nodes_expanded=nodes_expanded,
+            computation_time=computation_time,
+            success=True
+        )
 
 # Example usage and testing
 def test_astar():
@@ -0,0 +1,175 @@
+
+"""
+Jump Point Search for uniform-cost 4-connected grids
+"""
+import heapq
+import itertools
+from typing import List, Tuple, Dict, Optional, Callable
+import time
+
+from astar_sample import AStarSearch, Heuristics, SearchResult
+
+class JPSSearch:
+    """
+    Jump Point Search (JPS) Implementation
+
+    Uses a horizontal-first canonical ordering for 4-connected moves:
+    horizontal rays may turn vertically at any cell, while vertical rays only
+    stop where a horizontal turn is forced by an obstacle behind it. Only the
+    resulting jump points are pushed onto the open set.
+    """
+
+    def __init__(self, grid_world, heuristic: Callable = Heuristics.manhattan_distance):
+        self.grid_world = grid_world
+        self.heuristic = heuristic
+        self._fallback = AStarSearch(grid_world, heuristic)
+        self._blocked = None
+
+    def search(self, start: Tuple[int, int], goal: Tuple[int, int],
+               current_time: int = 0) -> SearchResult:
+        """
+        Perform JPS from start to goal
+
+        Falls back to A* when terrain costs are not uniform or dynamic
+        obstacles are active at current_time.
+
+        Args:
+            start: Starting position (x, y)
+            goal: Goal position (x, y)
+            current_time: Current time step for dynamic obstacles
+
+        Returns:
+            SearchResult containing path and metrics
+        """
+        invalid = self._fallback._invalid_endpoints(start, goal)
+        if invalid is not None:
+            return invalid
+
+        if (not self.grid_world.has_uniform_cost()
+                or self.grid_world.dynamic_obstacles.get(current_time)):
+            return self._fallback.search(start, goal, current_time)
+
+        start_time = time.time()
+        self._blocked = self.grid_world.blocked_rows()
+
+        counter = itertools.count()
+        g_score = {start: 0}
+        came_from = {}
+        open_set = [(self.heuristic(start, goal), next(counter), start)]
+        closed_set = set()
+        nodes_expanded = 0
+
+        while open_set:
+            _, _, current_pos = heapq.heappop(open_set)
+            if current_pos in closed_set:
+                continue
+
+            if current_pos == goal:
+                path = self._reconstruct_path(came_from, goal)
+                computation_time = time.time() - start_time
+                return SearchResult(
+                    path=path,
+                    cost=g_score[goal],
+                    nodes_expanded=nodes_expanded,
+                    computation_time=computation_time,
+                    success=True
+                )
+
+            closed_set.add(current_pos)
+            nodes_expanded += 1
+            current_g = g_score[current_pos]
+
+            for jump_pos in self._identify_successors(current_pos, came_from.get(current_pos), goal):
+                if jump_pos in closed_set:
+                    continue
+
+                # Jump points are reached along a straight ray
+                tentative_g_cost = current_g + abs(jump_pos[0] - current_pos[0]) \
+                    + abs(jump_pos[1] - current_pos[1])
+                if tentative_g_cost < g_score.get(jump_pos, float('inf')):
+                    g_score[jump_pos] = tentative_g_cost
+                    came_from[jump_pos] = current_pos
+                    f_cost = tentative_g_cost + self.heuristic(jump_pos, goal)
+                    heapq.heappush(open_set, (f_cost, next(counter), jump_pos))
+
+        computation_time = time.time() - start_time
+        return SearchResult(
+            path=[],
+            cost=float('inf'),
+            nodes_expanded=nodes_expanded,
+            computation_time=computation_time,
+            success=False
+        )
+
+    def _walkable(self, x: int, y: int) -> bool:
+        """Check if position is in bounds and not a static obstacle"""
+        return (0 <= x < self.grid_world.width and 0 <= y < self.grid_world.height
+                and not self._blocked[y][x])
+
+    def _identify_successors(self, pos: Tuple[int, int], parent: Optional[Tuple[int, int]],
+                             goal: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Return the jump points reachable from pos given the direction it was entered"""
+        x, y = pos
+        if parent is None:
+            directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+        else:
+            dx = (x > parent[0]) - (x < parent[0])
+            dy = (y > parent[1]) - (y < parent[1])
+            if dx:
+                directions = [(dx, 0), (0, 1), (0, -1)]
+            else:
+                directions = [(0, dy)]
+                for side in (1, -1):
+                    if self._walkable(x + side, y) and not self._walkable(x + side, y - dy):
+                        directions.append((side, 0))
+
+        successors = []
+        for dx, dy in directions:
+            jump_pos = self._jump(x, y, dx, dy, goal)
+            if jump_pos is not None:
+                successors.append(jump_pos)
+        return successors
+
+    def _jump(self, x: int, y: int, dx: int, dy: int,
+              goal: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """Scan from (x, y) in direction (dx, dy) until a jump point or a dead end"""
+        walkable = self._walkable
+        while True:
+            x += dx
+            y += dy
+            if not walkable(x, y):
+                return None
+            if (x, y) == goal:
+                return (x, y)
+
+            if dx:
+                # Any cell on a horizontal ray is a jump point if a vertical
+                # scan from it reaches one
+                if self._jump(x, y, 0, 1, goal) or self._jump(x, y, 0, -1, goal):
+                    return (x, y)
+            else:
+                # Forced neighbor: side cell open here but blocked one step back
+                for side in (1, -1):
+                    if walkable(x + side, y) and not walkable(x + side, y - dy):
+                        return (x, y)
+
+    def _reconstruct_path(self, came_from: Dict[Tuple[int, int], Tuple[int, int]],
+                          goal: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Reconstruct the full cell path by interpolating between jump points"""
+        jump_points = [goal]
+        current = goal
+        while current in came_from:
+            current = came_from[current]
+            jump_points.append(current)
+        jump_points.reverse()
+
+        path = [jump_points[0]]
+        for (x0, y0), (x1, y1) in zip(jump_points, jump_points[1:]):
+            dx = (x1 > x0) - (x1 < x0)
+            dy = (y1 > y0) - (y1 < y0)
+            x, y = x0, y0
+            while (x, y) != (x1, y1):
+                x += dx
+                y += dy
+                path.append((x, y))
+        return path
@@ -1,12 +1,13 @@
 # Create sample implementation templates for key project components
 
 # 1. Grid Environment Class
-grid_world_code = '''
+grid_world_code = r'''
 """
 Grid-based environment for autonomous delivery agent
 """
+import itertools
 import numpy as np
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional, Union
 from enum import Enum
 
 class CellType(Enum):
@@ -16,113 +17,161 @@ class CellType(Enum):
     GOAL = 3
     MOVING_OBSTACLE = 4
 
+_DIRS_4 = ((1, 0), (-1, 0), (0, 1), (0, -1))  # right, left, down, up
+
 class GridWorld:
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
-        self.grid = np.zeros((height, width), dtype=int)
+        self.grid = np.zeros((height, width), dtype=np.int8)
+        self._blocked = np.zeros((height, width), dtype=bool)  # static obstacle bitmap
+        self._blocked_rows = None  # nested-list copy of _blocked, see blocked_rows()
         self.start = None
         self.goal = None
         self.dynamic_obstacles = {}  # time -> [(x, y), ...]
-        
+        self._dyn_present = False
+
     def add_static_obstacle(self, x: int, y: int):
         """Add a static obstacle to the grid"""
         if self.is_valid_position(x, y):
             self.grid[y, x] = CellType.OBSTACLE.value
-            
+            self._blocked[y, x] = True
+            self._blocked_rows = None
+
     def add_dynamic_obstacle(self, positions: List[Tuple[int, int, int]]):
         """Add dynamic obstacle with time-position pairs"""
         for x, y, time in positions:
             if time not in self.dynamic_obstacles:
                 self.dynamic_obstacles[time] = []
             self.dynamic_obstacles[time].append((x, y))
-            
+        self._dyn_present = bool(self.dynamic_obstacles)
+
     def set_start_goal(self, start: Tuple[int, int], goal: Tuple[int, int]):
         """Set start and goal positions"""
         self.start = start
         self.goal = goal
+        self._blocked_rows = None
         if self.is_valid_position(*start):
             self.grid[start[1], start[0]] = CellType.START.value
+            self._blocked[start[1], start[0]] = False
         if self.is_valid_position(*goal):
             self.grid[goal[1], goal[0]] = CellType.GOAL.value
-            
+            self._blocked[goal[1], goal[0]] = False
+
     def is_valid_position(self, x: int, y: int) -> bool:
         """Check if position is within grid bounds"""
         return 0 <= x < self.width and 0 <= y < self.height
-        
+
+    def blocked_rows(self) -> List[List[bool]]:
+        """Static obstacle bitmap as nested lists, rebuilt only after it changes"""
+        if self._blocked_rows is None:
+            self._blocked_rows = self._blocked.tolist()
+        return self._blocked_rows
+
     def is_obstacle(self, x: int, y: int, time: int = 0) -> bool:
         """Check if position is obstacle at given time"""
         if not self.is_valid_position(x, y):
             return True
-        
+
         # Check static obstacles
-        if self.grid[y, x] == CellType.OBSTACLE.value:
+        if self._blocked[y, x]:
             return True
-            
+
         # Check dynamic obstacles
-        if time in self.dynamic_obstacles:
+        if self._dyn_present and time in self.dynamic_obstacles:
             return (x, y) in self.dynamic_obstacles[time]
-            
+
         return False
-        
-    def get_neighbors(self, x: int, y: int, time: int = 0) -> List[Tuple[int, int]]:
-        """Get valid neighboring positions (4-connected)"""
-        neighbors = []
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # right, down, left, up
-        
-        for dx, dy in directions:
+
+    def get_neighbors(self, x: int, y: int, time: int = 0) -> Iterator[Tuple[int, int]]:
+        """Yield valid neighboring positions (4-connected)"""
+        width, height, blocked = self.width, self.height, self._blocked
+        moving = self.dynamic_obstacles.get(time, ()) if self._dyn_present else ()
+
+        for dx, dy in _DIRS_4:
             nx, ny = x + dx, y + dy
-            if self.is_valid_position(nx, ny) and not self.is_obstacle(nx, ny, time):
-                neighbors.append((nx, ny))
-                
-        return neighbors
-        
+            if 0 <= nx < width and 0 <= ny < height and not blocked[ny, nx] \
+                    and (nx, ny) not in moving:
+                yield (nx, ny)
+
     def get_terrain_cost(self, x: int, y: int) -> int:
-        """Get movement cost for a cell (can be extended for different terrain types)"""
-        if self.is_obstacle(x, y):
-            return float('inf')
+        """
+        Get movement cost for a free cell (can be extended for different terrain types)
+
+        Obstacles are not checked here: callers only ask for cells yielded by
+        get_neighbors, which already filters them out.
+        """
         return 1  # Default cost
-        
+
+    def has_uniform_cost(self) -> bool:
+        """Whether every free cell has the same movement cost"""
+        return True
+
+    def has_integer_costs(self) -> bool:
+        """Whether every movement cost is an integer"""
+        return True
+
     def save_to_file(self, filename: str):
         """Save grid to file"""
         with open(filename, 'w') as f:
-            f.write(f"{self.width} {self.height}\\n")
+            f.write(f"{self.width} {self.height}\n")
             if self.start:
-                f.write(f"START {self.start[0]} {self.start[1]}\\n")
+                f.write(f"START {self.start[0]} {self.start[1]}\n")
             if self.goal:
-                f.write(f"GOAL {self.goal[0]} {self.goal[1]}\\n")
-            
-            for y in range(self.height):
-                for x in range(self.width):
-                    f.write(f"{self.grid[y, x]} ")
-                f.write("\\n")
-                
+                f.write(f"GOAL {self.goal[0]} {self.goal[1]}\n")
+
+            np.savetxt(f, self.grid, fmt='%d')
+
     @classmethod
-    def load_from_file(cls, filename: str):
-        """Load grid from file"""
+    def load_from_file(cls, filename: Union[str, int]):
+        """Load grid from file; filename may also be an open descriptor, which is closed"""
         with open(filename, 'r') as f:
-            lines = f.readlines()
-            
-        width, height = map(int, lines[0].strip().split())
-        grid = cls(width, height)
-        
-        line_idx = 1
-        while line_idx < len(lines) and not lines[line_idx].strip().split()[0].isdigit():
-            parts = lines[line_idx].strip().split()
-            if parts[0] == "START":
-                grid.start = (int(parts[1]), int(parts[2]))
-            elif parts[0] == "GOAL":
-                grid.goal = (int(parts[1]), int(parts[2]))
-            line_idx += 1
-            
-        # Load grid data
-        for y in range(height):
-            if line_idx + y < len(lines):
-                row = list(map(int, lines[line_idx + y].strip().split()))
-                for x in range(min(width, len(row))):
-                    grid.grid[y, x] = row[x]
-                    
+            width, height = map(int, f.readline().split())
+            grid = cls(width, height)
+
+            # Header: START/GOAL lines and an optional DYNAMIC_OBSTACLE block
+            line = f.readline()
+            while line:
+                parts = line.split()
+                if parts and parts[0].isdigit():
+                    break
+                if parts and parts[0] == "START":
+                    grid.start = (int(parts[1]), int(parts[2]))
+                elif parts and parts[0] == "GOAL":
+                    grid.goal = (int(parts[1]), int(parts[2]))
+                elif parts and parts[0] == "DYNAMIC_OBSTACLE":
+                    grid._load_dynamic_block(f)
+                line = f.readline()
+
+            # Load grid data: one loadtxt pass for a rectangular body; short,
+            # ragged or blank rows fill each row as far as it goes
+            if line:
+                body = list(itertools.islice(itertools.chain([line], f), height))
+                try:
+                    rows = np.loadtxt(body, dtype=np.int8, ndmin=2)
+                except ValueError:
+                    rows = None
+                if rows is not None and rows.shape[0] == len(body):
+                    cols = min(width, rows.shape[1])
+                    grid.grid[:rows.shape[0], :cols] = rows[:, :cols]
+                else:
+                    for y, row_line in enumerate(body):
+                        row = list(map(int, row_line.split()))[:width]
+                        grid.grid[y, :len(row)] = row
+
+        grid._blocked = grid.grid == CellType.OBSTACLE.value
         return grid
+
+    def _load_dynamic_block(self, f):
+        """Read 'x y time_start time_end' lines up to END_DYNAMIC"""
+        for line in f:
+            parts = line.split()
+            if not parts or parts[0].startswith('#'):
+                continue
+            if parts[0] == "END_DYNAMIC":
+                break
+            x, y, time_start, time_end = map(int, parts)
+            self.add_dynamic_obstacle([(x, y, t) for t in range(time_start, time_end + 1)])
 '''
 
 print("1. Grid World Environment Implementation:")
@@ -1,151 +1,534 @@
 # Create CLI interface implementation - fixed version
 
-cli_code = '''"""
+import os
+import sys
+
+cli_code = r'''"""
 Command Line Interface for Autonomous Delivery Agent
 """
-import argparse
+import functools
+import math
 import sys
 import os
-import json
-from pathlib import Path
-from typing import Dict, Any
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, Union
 
-# This would normally import from the project modules
+# Only what parsing needs is imported at module level; json, the process
+# pool and the project modules are imported inside the handlers that use
+# them, so --help and argument errors stay cheap. The project modules would
+# likewise be imported where each algorithm is dispatched:
 # from src.environment.grid_world import GridWorld
 # from src.algorithms.uninformed.bfs import BFSSearch
 # from src.algorithms.uninformed.uniform_cost_search import UCSSearch
 # from src.algorithms.informed.a_star import AStarSearch
+# from src.algorithms.informed.jps import JPSSearch
 # from src.algorithms.local_search.hill_climbing import HillClimbingSearch
 # from src.algorithms.local_search.simulated_annealing import SimulatedAnnealingSearch
 # from src.utils.visualization import Visualizer
 # from src.utils.metrics import MetricsCollector
 
-class DeliveryAgentCLI:
-    """Command Line Interface for the Autonomous Delivery Agent"""
-    
-    def __init__(self):
-        self.algorithms = {
-            'bfs': 'Breadth-First Search',
-            'ucs': 'Uniform Cost Search', 
-            'astar': 'A* Search',
-            'hill_climbing': 'Hill Climbing',
-            'simulated_annealing': 'Simulated Annealing'
-        }
-        
-    def create_parser(self) -> argparse.ArgumentParser:
-        """Create and configure argument parser"""
-        epilog_text = """
+def _run_one(algorithm: str, map_path: str, start=None, goal=None) -> dict:
+    """
+    Run one algorithm on one map; executed inside pool workers
+
+    Each worker loads the map itself so only the path crosses the process
+    boundary, not the grid.
+    """
+    import zlib
+
+    import numpy as np
+
+    from grid_world_sample import GridWorld
+
+    grid = GridWorld.load_from_file(map_path)
+    start = tuple(start) if start else grid.start
+    goal = tuple(goal) if goal else grid.goal
+
+    # This would be the actual search; metrics are simulated for now, drawn
+    # in one call from a generator seeded by the algorithm name (stable
+    # across processes, unlike hash())
+    rng = np.random.default_rng(zlib.crc32(algorithm.encode()))
+    cost_offset, nodes_offset, time_offset = rng.integers((10, 50, 100)).tolist()
+    return {
+        'algorithm': algorithm,
+        'map': map_path,
+        'start': start,
+        'goal': goal,
+        'path_cost': 42.0 + cost_offset,
+        'nodes_expanded': 150 + nodes_offset,
+        'computation_time': 0.02 + time_offset / 1000,
+        'success': True
+    }
+
+def _map_digest(map_path: str) -> bytes:
+    """blake2b digest of a map file's contents, read through mmap"""
+    import hashlib
+    import mmap
+
+    with open(map_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.blake2b(b'').digest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return hashlib.blake2b(data).digest()
+
+IO_URING_DEPTH = 256  # reads submitted to the ring per batch
+
+def _read_files_io_uring(paths):
+    """
+    Read whole files through io_uring, one batch of reads per submit
+
+    Raises:
+        ImportError: When the liburing bindings are not installed
+        OSError: When the kernel rejects the ring or a read fails
+    """
+    import liburing
+
+    contents = {}
+    ring = liburing.Ring()
+    cqe = liburing.Cqe()
+    liburing.io_uring_queue_init(IO_URING_DEPTH, ring)
+    try:
+        for base in range(0, len(paths), IO_URING_DEPTH):
+            batch = paths[base:base + IO_URING_DEPTH]
+            fds = []
+            buffers = []
+            try:
+                for i, path in enumerate(batch):
+                    fd = os.open(path, os.O_RDONLY)
+                    fds.append(fd)
+                    buffers.append(bytearray(os.fstat(fd).st_size))
+                    sqe = liburing.io_uring_get_sqe(ring)
+                    liburing.io_uring_prep_read(sqe, fd, buffers[i], 0)
+                    liburing.io_uring_sqe_set_data64(sqe, i)
+                liburing.io_uring_submit_and_wait(ring, len(batch))
+
+                done = 0
+                while done < len(batch):
+                    liburing.io_uring_wait_cqe(ring, cqe)
+                    ready = liburing.io_uring_cq_ready(ring)
+                    for k in range(ready):
+                        i, res = cqe[k].user_data, cqe[k].res
+                        if res < 0:
+                            raise OSError(-res, os.strerror(-res), batch[i])
+                        if res < len(buffers[i]):  # short read: finish synchronously
+                            buffers[i][res:] = os.pread(fds[i], len(buffers[i]) - res, res)
+                    liburing.io_uring_cq_advance(ring, ready)
+                    done += ready
+            finally:
+                for fd in fds:
+                    os.close(fd)
+            contents.update(zip(batch, map(bytes, buffers)))
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    return contents
+
+def _read_files(paths, use_io_uring: bool = False):
+    """Read whole files into {path: bytes}, batched through io_uring if asked and available"""
+    if use_io_uring and sys.platform.startswith('linux'):
+        try:
+            return _read_files_io_uring(paths)
+        except (ImportError, OSError) as e:
+            print(f"io_uring unavailable ({e}); reading maps sequentially")
+    contents = {}
+    for path in paths:
+        with open(path, 'rb') as f:
+            contents[path] = f.read()
+    return contents
+
+# Results of solved queries, keyed by (map digest, algorithm, start, goal).
+# The map file carries the static and dynamic obstacles, so its digest
+# stands in for the blocked cells.
+_path_cache: Dict[tuple, dict] = {}
+
+def _physical_cores() -> int:
+    """Physical core count from psutil when installed, else half the logical CPUs"""
+    try:
+        import psutil
+        cores = psutil.cpu_count(logical=False)
+    except ImportError:
+        cores = None
+    return cores or max(1, (os.cpu_count() or 1) // 2)
+
+def _make_executor(workers: int):
+    """
+    Process pool of the given size
+
+    Uses forkserver where available so workers start from a small clean
+    process rather than a fork of the parent.
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    context = (multiprocessing.get_context('forkserver')
+               if 'forkserver' in multiprocessing.get_all_start_methods() else None)
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context)
+
+def _run_jobs(jobs, workers: Optional[int] = None, digests: Optional[Dict[str, bytes]] = None,
+              executor=None):
+    """
+    Run (algorithm, map_path, start, goal) jobs in a process pool, in order
+
+    Each distinct query is solved once: repeated runs and identical map
+    files hit _path_cache, and only the misses are dispatched. Workers only
+    return result dicts; all printing and file writes happen in the parent
+    once every job is collected, so nothing is shared between processes.
+    workers defaults to one per query, capped at the physical core count
+    since the searches are CPU-bound and gain nothing from SMT siblings;
+    with a single worker the queries run in this process. executor, when
+    given, is an existing pool to dispatch to instead (workers is then
+    ignored). digests may hold precomputed map digests by path.
+    """
+    digests = dict(digests or ())
+    keys = []
+    pending = {}
+    for job in jobs:
+        algorithm, map_path, start, goal = job
+        if map_path not in digests:
+            digests[map_path] = _map_digest(map_path)
+        key = (digests[map_path], algorithm,
+               tuple(start) if start else None, tuple(goal) if goal else None)
+        keys.append(key)
+        if key not in _path_cache:
+            pending.setdefault(key, job)
+
+    if pending:
+        if executor is not None:
+            solved = list(executor.map(_run_one, *zip(*pending.values())))
+        else:
+            if workers is None:
+                workers = min(len(pending), _physical_cores())
+            if workers == 1:
+                solved = [_run_one(*job) for job in pending.values()]
+            else:
+                with _make_executor(workers) as executor:
+                    solved = list(executor.map(_run_one, *zip(*pending.values())))
+        _path_cache.update(zip(pending, solved))
+
+    return [_path_cache[key] for key in keys]
+
+def _finite(data):
+    """Copy of data with NaN/inf floats replaced by None, e.g. cost=inf on failure"""
+    if isinstance(data, float):
+        return data if math.isfinite(data) else None
+    if isinstance(data, dict):
+        return {key: _finite(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_finite(value) for value in data]
+    return data
+
+def _write_json(path: str, data) -> None:
+    """
+    Write data as indented JSON with a single write, using orjson when installed
+
+    Non-finite floats are written as null on both paths; orjson does that
+    itself while the stdlib would emit non-standard NaN/Infinity.
+    """
+    data = _finite(data)
+    try:
+        import orjson
+    except ImportError:
+        import json
+        payload = json.dumps(data, indent=2, allow_nan=False).encode()
+    else:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    with open(path, 'wb') as f:
+        f.write(payload)
+
+# Comparison table layout; bound str.format so each row skips f-string setup
+_HEADER_FMT = "{:<20} {:<10} {:<12} {:<12} {:<12}".format
+_ROW_FMT = "{:<20} {:<10.1f} {:<12} {:<12.3f} {:<12.1%}".format
+
+def _summarize(runs) -> dict:
+    """Average the metrics of repeated runs"""
+    import numpy as np
+
+    # Gather the runs into one column per metric and reduce each column
+    n = len(runs)
+    costs = np.empty(n, dtype=np.float64)
+    nodes = np.empty(n, dtype=np.int64)
+    times = np.empty(n, dtype=np.float64)
+    successes = np.empty(n, dtype=bool)
+    for i, r in enumerate(runs):
+        costs[i] = r['path_cost']
+        nodes[i] = r['nodes_expanded']
+        times[i] = r['computation_time']
+        successes[i] = r['success']
+    return {
+        'avg_path_cost': float(costs.mean()),
+        'avg_nodes_expanded': float(nodes.mean()),
+        'avg_computation_time': float(times.mean()),
+        'success_rate': float(successes.mean())
+    }
+
+ALGORITHMS = {
+    'bfs': 'Breadth-First Search',
+    'ucs': 'Uniform Cost Search', 
+    'astar': 'A* Search',
+    'jps': 'Jump Point Search',
+    'hill_climbing': 'Hill Climbing',
+    'simulated_annealing': 'Simulated Annealing'
+}
+
+# Rough relative cost of one run per map byte, for ordering benchmark work
+ALG_WEIGHT = {
+    'bfs': 1.0,
+    'ucs': 2.0,
+    'astar': 1.5,
+    'jps': 1.0,
+    'hill_climbing': 0.5,
+    'simulated_annealing': 3.0
+}
+
+EPILOG = """
 Examples:
   python cli.py run --algorithm astar --map maps/small_map.txt
   python cli.py run --algorithm bfs --map maps/medium_map.txt --visualize
   python cli.py compare --algorithms bfs ucs astar --map maps/large_map.txt
-  python cli.py benchmark --map-dir maps/ --output results/benchmark.json
+  python cli.py benchmark --map-dir maps/ --output results/benchmark.json"""
+
+REQUIRED = object()  # Option.default marker for mandatory options
+
+class Option(NamedTuple):
+    """
+    Command-line option descriptor
+
+    nargs is 0 for a flag, a count of values, or '+' for one or more;
+    kind converts each value: a type such as int, float or str, or a
+    Choices set. aliases are extra long spellings accepted for the option.
+    """
+    long: str
+    short: Optional[str]
+    nargs: Union[int, str]
+    kind: Callable[[str], Any]
+    default: Any
+    help: str
+    metavar: Optional[str] = None
+    aliases: Tuple[str, ...] = ()
+
+class UsageError(Exception):
+    """Invalid command line; command is the subcommand being parsed, if any"""
+
+    def __init__(self, message: str, command: Optional[str] = None):
+        super().__init__(message)
+        self.command = command
+
+class Choices(frozenset):
+    """Accepted values of an option, usable as its converter (O(1) membership check)"""
+
+    def __call__(self, value: str) -> str:
+        if value not in self:
+            raise ValueError(value)
+        return value
+
+_ALGORITHM_CHOICES = Choices(ALGORITHMS)
+
+COMMANDS = {
+    'run': ('Run single pathfinding algorithm', (
+        Option('--algorithm', '-a', 1, _ALGORITHM_CHOICES, REQUIRED, 'Pathfinding algorithm to use'),
+        Option('--map', '-m', 1, str, REQUIRED, 'Path to map file'),
+        Option('--start', None, 2, int, None, 'Start position (overrides map default)', 'X Y'),
+        Option('--goal', None, 2, int, None, 'Goal position (overrides map default)', 'X Y'),
+        Option('--visualize', '-v', 0, bool, False, 'Show path visualization'),
+        Option('--save-result', None, 1, str, None, 'Save results to JSON file'),
+        Option('--dynamic', None, 0, bool, False, 'Enable dynamic obstacle simulation'),
+        Option('--heuristic', None, 1, Choices(('manhattan', 'euclidean', 'diagonal')), 'manhattan',
+               'Heuristic function for A*/JPS (default: manhattan)'),
+    )),
+    'compare': ('Compare multiple algorithms', (
+        Option('--algorithms', None, '+', _ALGORITHM_CHOICES, REQUIRED, 'Algorithms to compare'),
+        Option('--map', '-m', 1, str, REQUIRED, 'Path to map file'),
+        Option('--runs', None, 1, int, 1, 'Number of runs per algorithm (default: 1)'),
+        Option('--output', '-o', 1, str, None, 'Output file for comparison results'),
+        Option('--visualize', '-v', 0, bool, False, 'Show comparison charts'),
+        Option('--jobs', '-j', 1, int, None,
+               'Worker processes (default: one per run, up to the physical cores)', 'N',
+               ('--max-parallel',)),
+    )),
+    'benchmark': ('Run comprehensive benchmarks', (
+        Option('--map-dir', None, 1, str, REQUIRED, 'Directory containing map files'),
+        Option('--algorithms', None, '+', _ALGORITHM_CHOICES, tuple(ALGORITHMS),
+               'Algorithms to benchmark (default: all)'),
+        Option('--output', '-o', 1, str, REQUIRED, 'Output file for benchmark results'),
+        Option('--runs', None, 1, int, 5, 'Number of runs per test case (default: 5)'),
+        Option('--jobs', '-j', 1, int, None,
+               'Worker processes (default: one per run, up to the physical cores)', 'N',
+               ('--max-parallel',)),
+        Option('--io-uring', None, 0, bool, False, 'Batch-read the map files through io_uring (Linux)'),
+        Option('--chunk-size', None, 1, int, 32,
+               'Runs per checkpoint in OUTPUT.partial; rerun to resume (default: 32)', 'N'),
+    )),
+    'generate-map': ('Generate test maps', (
+        Option('--size', None, 2, int, REQUIRED, 'Map dimensions', 'WIDTH HEIGHT'),
+        Option('--obstacle-density', None, 1, float, 0.2, 'Obstacle density (0.0-1.0, default: 0.2)'),
+        Option('--output', '-o', 1, str, REQUIRED, 'Output map file'),
+        Option('--dynamic-obstacles', None, 1, int, 0, 'Number of dynamic obstacles (default: 0)'),
+        Option('--seed', None, 1, int, None, 'Random seed for reproducibility'),
+    )),
+}
+
+# Long, short and alias spellings of every option, per command
+_OPTION_INDEX = {
+    command: {name: option for option in options
+              for name in (option.long, option.short, *option.aliases) if name}
+    for command, (_, options) in COMMANDS.items()
+}
+
+def _dest(option: Option) -> str:
+    """Namespace attribute for an option ('--map-dir' -> 'map_dir')"""
+    return option.long[2:].replace('-', '_')
+
+def _metavar(option: Option) -> str:
+    """Value placeholder shown in help"""
+    if option.nargs == 0:
+        return ''
+    if isinstance(option.kind, Choices):
+        placeholder = '{' + ','.join(sorted(option.kind)) + '}'
+    else:
+        placeholder = option.metavar or option.long[2:].upper().replace('-', '_')
+    return f"{placeholder} [...]" if option.nargs == '+' else placeholder
+
+def _convert(option: Option, name: str, value: str, command: str):
+    """Convert one raw value with the option's kind"""
+    try:
+        return option.kind(value)
+    except ValueError:
+        if isinstance(option.kind, Choices):
+            raise UsageError(f"invalid choice for '{name}': '{value}' "
+                             f"(choose from {', '.join(sorted(option.kind))})", command) from None
+        raise UsageError(f"invalid {option.kind.__name__} value for '{name}': '{value}'",
+                         command) from None
+
+@functools.lru_cache(maxsize=None)
+def _help_text(prog: str, command: Optional[str]) -> str:
+    """Render help from COMMANDS; the tables are static, so each text is built once"""
+    if command is None:
+        lines = [f"usage: {prog} <command> [options]", "",
+                 "Autonomous Delivery Agent Pathfinding System", "", "Commands:"]
+        lines += [f"  {name:<14}{summary}" for name, (summary, _) in COMMANDS.items()]
+        lines.append(EPILOG)
+    else:
+        summary, options = COMMANDS[command]
+        lines = [f"usage: {prog} {command} [options]", "", summary, "", "Options:"]
+        for option in options:
+            flags = ', '.join(name for name in (option.long, option.short, *option.aliases) if name)
+            spec = f"{flags} {_metavar(option)}".rstrip()
+            note = ' (required)' if option.default is REQUIRED else ''
+            if len(spec) < 34:
+                lines.append(f"  {spec:<34}{option.help}{note}")
+            else:
+                lines += [f"  {spec}", f"  {'':<34}{option.help}{note}"]
+    return '\n'.join(lines)
+
+class DeliveryAgentCLI:
+    """Command Line Interface for the Autonomous Delivery Agent"""
+
+    def __init__(self):
+        self.algorithms = ALGORITHMS
+
+    def parse_args(self, argv):
+        """
+        Parse argv (without the program name) into a namespace
+
+        The first token selects the subcommand; the rest is scanned once,
+        accepting --flag, --flag=value and -f value forms.
+
+        Returns:
+            Namespace with a 'command' attribute and one attribute per option
+            of that command; command is None when help was requested
+
+        Raises:
+            UsageError: On an unknown command or option, a missing value or
+                required option, or a value that fails type/choice validation
         """
-        
-        parser = argparse.ArgumentParser(
-            description='Autonomous Delivery Agent Pathfinding System',
-            formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog=epilog_text
-        )
-        
-        subparsers = parser.add_subparsers(dest='command', help='Available commands')
-        
-        # Run command
-        self._add_run_parser(subparsers)
-        
-        # Compare command
-        self._add_compare_parser(subparsers)
-        
-        # Benchmark command
-        self._add_benchmark_parser(subparsers)
-        
-        # Generate map command
-        self._add_generate_map_parser(subparsers)
-        
-        return parser
-    
-    def _add_run_parser(self, subparsers):
-        """Add run command parser"""
-        run_parser = subparsers.add_parser('run', help='Run single pathfinding algorithm')
-        
-        run_parser.add_argument(
-            '--algorithm', '-a',
-            choices=list(self.algorithms.keys()),
-            required=True,
-            help='Pathfinding algorithm to use'
-        )
-        
-        run_parser.add_argument(
-            '--map', '-m',
-            type=str,
-            required=True,
-            help='Path to map file'
-        )
-        
-        run_parser.add_argument(
-            '--start',
-            type=int,
-            nargs=2,
-            metavar=('X', 'Y'),
-            help='Start position (overrides map default)'
-        )
-        
-        run_parser.add_argument(
-            '--goal',
-            type=int,
-            nargs=2,
-            metavar=('X', 'Y'),
-            help='Goal position (overrides map default)'
-        )
-        
-        run_parser.add_argument(
-            '--visualize', '-v',
-            action='store_true',
-            help='Show path visualization'
-        )
-        
-        run_parser.add_argument(
-            '--save-result',
-            type=str,
-            help='Save results to JSON file'
-        )
-        
-        run_parser.add_argument(
-            '--dynamic',
-            action='store_true',
-            help='Enable dynamic obstacle simulation'
-        )
-        
-        run_parser.add_argument(
-            '--heuristic',
-            choices=['manhattan', 'euclidean', 'diagonal'],
-            default='manhattan',
-            help='Heuristic function for A* (default: manhattan)'
-        )
-    
+        if not argv or argv[0] in ('-h', '--help'):
+            return SimpleNamespace(command=None, help_for=None)
+
+        command = argv[0]
+        index = _OPTION_INDEX.get(command)
+        if index is None:
+            raise UsageError(f"invalid command '{command}' (choose from {', '.join(COMMANDS)})")
+
+        values = {}
+        i, n = 1, len(argv)
+        while i < n:
+            token = argv[i]
+            i += 1
+            if token in ('-h', '--help'):
+                return SimpleNamespace(command=None, help_for=command)
+
+            if token.startswith('--'):
+                name, has_inline, inline = token.partition('=')
+            else:
+                name, has_inline, inline = token, '', ''
+            option = index.get(name)
+            if option is None:
+                raise UsageError(f"unrecognized argument '{token}'", command)
+
+            dest = _dest(option)
+            if option.nargs == 0:
+                if has_inline:
+                    raise UsageError(f"option '{name}' takes no value", command)
+                values[dest] = True
+                continue
+
+            raw = [inline] if has_inline else []
+            if option.nargs == '+':
+                while i < n and not argv[i].startswith('-'):
+                    raw.append(argv[i])
+                    i += 1
+                if not raw:
+                    raise UsageError(f"option '{name}' expects at least one value", command)
+            else:
+                needed = option.nargs - len(raw)
+                raw.extend(argv[i:i + needed])
+                i += needed
+                if len(raw) != option.nargs:
+                    raise UsageError(f"option '{name}' expects {option.nargs} value(s)", command)
+
+            converted = [_convert(option, name, value, command) for value in raw]
+            values[dest] = converted[0] if option.nargs == 1 else converted
+
+        for option in COMMANDS[command][1]:
+            dest = _dest(option)
+            if dest not in values:
+                if option.default is REQUIRED:
+                    raise UsageError(f"option '{option.long}' is required", command)
+                values[dest] = option.default
+
+        return SimpleNamespace(command=command, **values)
+
+    def print_help(self, command=None, file=None):
+        """Print top-level help, or the options of one command"""
+        print(_help_text(os.path.basename(sys.argv[0]), command), file=file)
+
     def run_algorithm(self, args):
         """Execute single algorithm run"""
         print(f"Running {self.algorithms[args.algorithm]} on {args.map}")
-        
-        # Load map
-        if not os.path.exists(args.map):
+
+        # Load map; opening it doubles as the existence check, and the
+        # loader takes ownership of the descriptor
+        try:
+            fd = os.open(args.map, os.O_RDONLY)
+        except FileNotFoundError:
             print(f"Error: Map file '{args.map}' not found")
             return 1
-        
-        # This would be the actual implementation
-        print("Map loaded successfully")
-        
+
+        from grid_world_sample import GridWorld
+
+        grid = GridWorld.load_from_file(fd)
+        print(f"Map loaded successfully ({grid.width}x{grid.height})")
+
         if args.start:
             print(f"Start position: {args.start}")
         if args.goal:
             print(f"Goal position: {args.goal}")
-            
+
         if args.dynamic:
             print("Dynamic obstacles enabled")
-            
-        if args.algorithm == 'astar' and args.heuristic:
+
+        if args.algorithm in ('astar', 'jps') and args.heuristic:
             print(f"Using {args.heuristic} heuristic")
-        
+
         # Simulate results
         result = {
             'algorithm': args.algorithm,
@@ -156,41 +539,207 @@ Examples:
             'success': True,
             'path_length': 28
         }
-        
+
         print("Results:")
         print(f"  Path found: {result['success']}")
         print(f"  Path cost: {result['path_cost']}")
         print(f"  Path length: {result['path_length']}")
         print(f"  Nodes expanded: {result['nodes_expanded']}")
         print(f"  Computation time: {result['computation_time']:.3f}s")
-        
+
         if args.save_result:
-            with open(args.save_result, 'w') as f:
-                json.dump(result, f, indent=2)
+            _write_json(args.save_result, result)
             print(f"Results saved to {args.save_result}")
-        
+
         if args.visualize:
             print("Visualization would be displayed here")
-            
+
         return 0
-    
-    def main(self):
+
+    def compare_algorithms(self, args):
+        """Execute algorithm comparison"""
+        print(f"Comparing algorithms: {', '.join(args.algorithms)}")
+        print(f"Map: {args.map}")
+        print(f"Runs per algorithm: {args.runs}")
+
+        if not os.path.exists(args.map):
+            print(f"Error: Map file '{args.map}' not found")
+            return 1
+        if args.runs < 1:
+            print("Error: --runs must be at least 1")
+            return 1
+        if args.jobs is not None and args.jobs < 1:
+            print("Error: --jobs must be at least 1")
+            return 1
+
+        # Every (algorithm, run) pair is independent, so fan them out
+        jobs = [(alg, args.map, None, None) for alg in args.algorithms for _ in range(args.runs)]
+        runs = _run_jobs(jobs, args.jobs)
+
+        results = {}
+        for i, alg in enumerate(args.algorithms):
+            results[alg] = _summarize(runs[i * args.runs:(i + 1) * args.runs])
+
+        # The table is assembled first and written in one call
+        lines = ["Comparison Results:",
+                 _HEADER_FMT('Algorithm', 'Avg Cost', 'Avg Nodes', 'Avg Time (s)', 'Success Rate'),
+                 "-" * 68]
+        lines += [_ROW_FMT(self.algorithms[alg], data['avg_path_cost'], data['avg_nodes_expanded'],
+                           data['avg_computation_time'], data['success_rate'])
+                  for alg, data in results.items()]
+        sys.stdout.write('\n'.join(lines) + '\n')
+
+        if args.output:
+            _write_json(args.output, results)
+            print(f"Results saved to {args.output}")
+
+        return 0
+
+    def run_benchmark(self, args):
+        """Execute comprehensive benchmark"""
+        print(f"Running benchmark on maps in {args.map_dir}")
+        print(f"Algorithms: {', '.join(args.algorithms)}")
+        print(f"Runs per test: {args.runs}")
+
+        if not os.path.isdir(args.map_dir):
+            print(f"Error: Map directory '{args.map_dir}' not found")
+            return 1
+        if args.runs < 1:
+            print("Error: --runs must be at least 1")
+            return 1
+        if args.jobs is not None and args.jobs < 1:
+            print("Error: --jobs must be at least 1")
+            return 1
+        if args.chunk_size < 1:
+            print("Error: --chunk-size must be at least 1")
+            return 1
+
+        import hashlib
+        import json
+
+        with os.scandir(args.map_dir) as entries:
+            maps = sorted(entry.path for entry in entries
+                          if entry.name.endswith('.txt') and entry.is_file())
+        contents = _read_files(maps, args.io_uring)
+        digests = {map_path: hashlib.blake2b(data).digest() for map_path, data in contents.items()}
+
+        groups = [(map_path, alg) for map_path in maps for alg in args.algorithms]
+        items = [(map_path, alg, run) for map_path, alg in groups for run in range(args.runs)]
+
+        # Finished runs are appended to a JSON-lines sidecar after every
+        # chunk; a rerun with the same output skips what it already holds
+        partial_path = args.output + '.partial'
+        done = {}
+        if os.path.exists(partial_path):
+            with open(partial_path) as f:
+                lines = [line for line in f if line.strip()]
+            # A crash mid-write leaves a truncated final line: drop it and
+            # rewrite the sidecar so the next append starts on a fresh line
+            if lines and not lines[-1].endswith('\n'):
+                try:
+                    json.loads(lines[-1])
+                    lines[-1] += '\n'
+                except json.JSONDecodeError:
+                    print("Discarding truncated last checkpoint line")
+                    del lines[-1]
+                with open(partial_path, 'w') as f:
+                    f.writelines(lines)
+            for line in lines:
+                record = json.loads(line)
+                done[(record['map'], record['algorithm'], record['run'])] = record['result']
+            print(f"Resuming: {sum(item in done for item in items)} of {len(items)} runs already done")
+
+        # Longest-processing-time first: start the most expensive runs
+        # early so the pool does not idle on one big map at the end
+        pending = sorted((item for item in items if item not in done),
+                         key=lambda item: len(contents[item[0]]) * ALG_WEIGHT.get(item[1], 1.0),
+                         reverse=True)
+        chunks = [pending[i:i + args.chunk_size] for i in range(0, len(pending), args.chunk_size)]
+        try:
+            from tqdm import tqdm
+            progress = tqdm(chunks, desc='Benchmark', unit='chunk')
+        except ImportError:
+            progress = chunks
+
+        # One pool serves every chunk; starting a pool per chunk would
+        # dominate short runs
+        workers = args.jobs
+        if workers is None:
+            workers = min(len({item[:2] for item in pending}), _physical_cores())
+        executor = _make_executor(workers) if workers > 1 else None
+
+        try:
+            with open(partial_path, 'a') as partial:
+                for n, chunk in enumerate(progress, 1):
+                    runs = _run_jobs([(alg, map_path, None, None) for map_path, alg, _ in chunk],
+                                     1, digests, executor)
+                    partial.write(''.join(
+                        json.dumps({'map': map_path, 'algorithm': alg, 'run': run,
+                                    'result': result}) + '\n'
+                        for (map_path, alg, run), result in zip(chunk, runs)))
+                    partial.flush()
+                    done.update(zip(chunk, runs))
+                    if progress is chunks:
+                        print(f"Chunk {n}/{len(chunks)} done")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        results = {}
+        for i, (map_path, alg) in enumerate(groups):
+            group_runs = [done[item] for item in items[i * args.runs:(i + 1) * args.runs]]
+            results.setdefault(map_path, {})[alg] = _summarize(group_runs)
+
+        _write_json(args.output, results)
+        os.remove(partial_path)
+
+        print(f"Benchmark completed: {len(maps)} maps, {len(items)} runs")
+        print(f"Results saved to {args.output}")
+
+        return 0
+
+    def generate_map(self, args):
+        """Generate test map"""
+        print(f"Generating {args.size[0]}x{args.size[1]} map")
+        print(f"Obstacle density: {args.obstacle_density}")
+        print(f"Dynamic obstacles: {args.dynamic_obstacles}")
+
+        if args.seed:
+            print(f"Using seed: {args.seed}")
+
+        # This would be the actual map generation
+        print(f"Map saved to {args.output}")
+
+        return 0
+
+    def main(self, argv=None):
         """Main CLI entry point"""
-        parser = self.create_parser()
-        args = parser.parse_args()
-        
+        if argv is None:
+            argv = sys.argv[1:]
+        try:
+            args = self.parse_args(argv)
+        except UsageError as e:
+            prog = os.path.basename(sys.argv[0])
+            if e.command:
+                prog = f"{prog} {e.command}"
+            print(f"usage: {prog} {'' if e.command else '<command> '}[options]\n"
+                  f"{prog}: error: {e}", file=sys.stderr)
+            return 2
+
         if not args.command:
-            parser.print_help()
-            return 1
-        
+            self.print_help(args.help_for)
+            return 0 if argv else 1
+
         try:
             if args.command == 'run':
                 return self.run_algorithm(args)
-            # Other commands would be implemented here
+            elif args.command == 'compare':
+                return self.compare_algorithms(args)
+            elif args.command == 'benchmark':
+                return self.run_benchmark(args)
             else:
-                parser.print_help()
-                return 1
-                
+                return self.generate_map(args)
+
         except KeyboardInterrupt:
             print("Operation cancelled by user")
             return 1
@@ -202,12 +751,24 @@ if __name__ == '__main__':
     cli = DeliveryAgentCLI()
     sys.exit(cli.main())'''
 
+cli_bytes = cli_code.encode('utf-8')
+
 print("3. CLI Interface Implementation:")
 print("=" * 50)
-print(cli_code)
+if os.environ.get("DUMP_CLI"):
+    # One binary write instead of streaming the source through the text codec
+    sys.stdout.flush()
+    sys.stdout.buffer.write(cli_bytes + b"\n")
+    sys.stdout.buffer.flush()
 
-# Save to file
-with open("cli_sample.py", "w") as f:
-    f.write(cli_code)
+# Save to file: write the encoded source in one syscall, looping only
+# if the kernel accepts a partial write
+fd = os.open("cli_sample.py", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+try:
+    view = memoryview(cli_bytes)
+    while view:
+        view = view[os.write(fd, view):]
+finally:
+    os.close(fd)
 
-print("\n\nSaved to 'cli_sample.py'")
\ No newline at end of file
+print(f"\n\nSaved {len(cli_bytes)} bytes to 'cli_sample.py' (set DUMP_CLI=1 to print the source)")